@@ -8,17 +8,19 @@ from .game_object import GameObject
 
 from pg_engine.core.bases import ClassRegistry, Initializer
 
-for to_initialize in [
-    RectColliderComponent,
-    ScriptComponent,
-    TransformComponent2D,
-    SpriteComponent,
-    GameObject,
-]:
-    Initializer.add_hooks(
-        lambda c=to_initialize: ClassRegistry.register(c),
-        None,
-    )
+Initializer.add_hooks(
+    lambda: ClassRegistry.register_many({
+        c.__name__: c
+        for c in [
+            RectColliderComponent,
+            ScriptComponent,
+            TransformComponent2D,
+            SpriteComponent,
+            GameObject,
+        ]
+    }),
+    None,
+)
 
 __all__ = [
     # 'ColliderComponent',
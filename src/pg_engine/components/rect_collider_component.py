@@ -15,6 +15,9 @@ class RectColliderComponent(TColliderComponent):
 
     """Rectangular shaped collider."""
 
+    # the mask of this collider is always filled
+    narrow_phase = 'rect'
+
     def __init__(
         self,
         rect: tuple[int, int, int, int],
@@ -83,14 +83,31 @@ class TransformComponent2D(TransformComponent):
         :type angle: int, optional
         """
         super().__init__(**kw)
-        self.x = x
-        self.y = y
+        # stored as a tuple so reading the position does not create a new one,
+        # it only changes when the transform moves
+        self._position: tuple[int | float, int | float] = (x, y)
         self.angle = angle
 
+    @property
+    def x(self) -> int | float:
+        return self._position[0]
+
+    @x.setter
+    def x(self, x: float) -> None:
+        self._position = (x, self._position[1])
+
+    @property
+    def y(self) -> int | float:
+        return self._position[1]
+
+    @y.setter
+    def y(self, y: float) -> None:
+        self._position = (self._position[0], y)
+
     # --- REQUIRED PROPERTIES ---
     @property
     def position(self) -> Iterable[int | float]:
-        return (self.x, self.y)
+        return self._position
 
     @property
     def rotation(self) -> Iterable[int | float]:
@@ -112,10 +129,11 @@ class TransformComponent2D(TransformComponent):
     # --- TRANSFORMATIONS ---
     def move(self, move_data: tuple[int, int], absolute: bool = False) -> None:
         if absolute:
-            self.x, self.y = move_data
+            x, y = move_data
+            self._position = (x, y)
             return
-        self.x += move_data[0]
-        self.y += move_data[1]
+        x, y = self._position
+        self._position = (x + move_data[0], y + move_data[1])
 
     def rotate(self, rotation: tuple[int], absolute: bool = False) -> None:
         if absolute:
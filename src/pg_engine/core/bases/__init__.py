@@ -13,18 +13,20 @@ from .wrappers import *
 from .scene import Scene, SceneBuilder
 from .camera import Camera2D
 
-for to_register in [
-    BaseGame,
-    BaseRenderer,
-    ContextRegistry,
-    SceneBuilder,
-    Scene,
-    Camera2D,
-]:
-    Initializer.add_hooks(
-        lambda to_register=to_register: ClassRegistry.register(to_register),
-        None,
-    )
+Initializer.add_hooks(
+    lambda: ClassRegistry.register_many({
+        c.__name__: c
+        for c in [
+            BaseGame,
+            BaseRenderer,
+            ContextRegistry,
+            SceneBuilder,
+            Scene,
+            Camera2D,
+        ]
+    }),
+    None,
+)
 
 try:
     from .pygame_gui_uimanager import PygameGuiUIManager, PygameGuiRegistry
@@ -106,6 +106,9 @@ class TSpriteConfig(TypedDict):
     rect: tuple[int, int, int, int]
     #: colorkey of the spritesheet
     colorkey: tuple[int, int, int]
+    #: load sprites as views sharing the spritesheet's pixels and alpha,
+    #: only applies without a colorkey
+    share_pixels: bool
     #: names of sprites left to right, then top to bottom
     bindings: list[str]
 
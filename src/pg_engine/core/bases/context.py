@@ -25,9 +25,9 @@ class ContextRegistry(TRegistry[ContextVar]):
         :return: value stored in the contextvar or none if not found
         :rtype: Any | None
         """
-        if not cls.has(ctx):
+        ctxvar: ContextVar | None = cls._registry.get(ctx)  # get contextvar
+        if ctxvar is None:
             return None
-        ctxvar: ContextVar = cls.get(ctx)  # get contextvar
         return ctxvar.get()  # get value from context
 
 
@@ -546,6 +546,11 @@ class TColliderComponent(TComponent, TRenderable, metaclass=PostInit):
 
     """Base class of components used in collision checks."""
 
+    #: collision check used once bounding rectangles overlap, 'mask' compares
+    #: :attr:`mask` pixels, 'rect' accepts any overlap of the rectangles.
+    #: masks are compared unless both colliders use 'rect'
+    narrow_phase: str = 'mask'
+
     def __init__(
         self,
         collision_layers: list[str],
@@ -644,20 +649,21 @@ class TCollisionSystem(TSystem, Singleton):
             self,
             interraction: frozenset[str],
         ) -> tuple[
-            pygame.sprite.Group,
-            pygame.sprite.Group,
+            tuple[TColliderComponent, ...],
+            tuple[TColliderComponent, ...],
             bool,
         ]:
         """
         Get Collision Data.
 
-        Gets two spritegroups and a bool indicating whether the\
+        Gets two sequences of colliders and a bool indicating whether the\
             collision groups are the same.
 
         :param interraction: the interraction (set by :func:`~.enable_collision`)
         :type interraction: frozenset[str]
         :return: Collision data
-        :rtype: tuple[ pygame.sprite.Group, pygame.sprite.Group, bool, ]
+        :rtype: tuple[ tuple[TColliderComponent, ...], tuple[TColliderComponent, ...],\
+            bool, ]
         """
 
     @abstractmethod
@@ -1002,6 +1008,21 @@ class TGameObjectBuilder(Builder[TGameObject], Singleton):
 
     __singleton_key__ = 'GameObjectBuilder'
 
+    #: scenes built gameobjects get added to while bound by :func:`bind`
+    scenes: dict[str, TScene] | None = None
+
+    def bind(self, game: TGame | None) -> None:
+        """
+        Bind the scenes built gameobjects get added to.
+
+        Saves looking up :class:`TGame` for every built gameobject, bind None once\
+            done such that later builds look up the game again.
+
+        :param game: game whose scenes built gameobjects get added to, None to unbind
+        :type game: TGame | None
+        """
+        self.scenes = None if game is None else game.scenes
+
 
 class TSceneBuilder(Builder[TScene], Singleton):
 
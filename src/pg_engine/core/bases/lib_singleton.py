@@ -2,10 +2,17 @@ from __future__ import annotations
 
 import logging
 import weakref
+from collections.abc import Iterable
 from typing import ClassVar, Literal, Self, final
 
 logger = logging.getLogger(__name__)
 
+# distinguishes missing registry entries from entries registered as None
+_MISSING = object()
+
+# storage of every TRegistry, emptied by Singleton.clear
+_registry_storages: list[dict] = []
+
 
 class Singleton:
 
@@ -37,10 +44,11 @@ class Singleton:
 
         If :term:`__destroyable__` is set to false log a warning instead.
         """
-        logger.debug(
-            'Singleton: Destroying %s',
-            cls.__name__,
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                'Singleton: Destroying %s',
+                cls.__name__,
+            )
         if cls.__destroyable__ and cls.__singleton_key__ in Singleton._instances:
             del Singleton._instances[cls.__singleton_key__]
             return
@@ -54,15 +62,13 @@ class Singleton:
         """
         Return an existing singleton (by :term:`__singleton_key__`) or create a new one.
 
+        :raises ValueError: raised when :term:`__singleton_key__` is not set
         :return: an instance of the Singleton (sub)class
         :rtype: Self
         """
         if cls.__singleton_key__ is None:
-            logger.error(
-                'Singleton[%s]: __singleton_key__ cannot be None',
-                cls.__name__,
-            )
-            return None
+            message = f'Singleton[{cls.__name__}]: __singleton_key__ cannot be None'
+            raise ValueError(message)
         if cls.__singleton_key__ not in cls._instances:
             instance = super().__new__(cls)
             instance.__init__(*args, **kw)
@@ -98,8 +104,15 @@ class Singleton:
 
     @classmethod
     def clear(cls) -> None:
-        """Discard internal registry of instantiated singletons."""
+        """
+        Discard internal registry of instantiated singletons.
+
+        Also empties every :class:`TRegistry`, their entries are not kept on a\
+            singleton instance.
+        """
         cls._instances.clear()
+        for storage in _registry_storages:
+            storage.clear()
 
 
 class TRegistry[T](Singleton):
@@ -107,9 +120,23 @@ class TRegistry[T](Singleton):
     """Non destroyable Generic[T] Singleton used to register and store one type of object."""  # noqa: E501
 
     __destroyable__: Literal[False] = False
+    _registry: ClassVar[dict[str, T]] = {}
+
+    def __init_subclass__(cls, **kw):
+        """
+        Give each registry it's own storage.
+
+        Subclasses not defining their own :term:`__singleton_key__` share the\
+            storage of their parent as they resolve to the same singleton.
 
-    def __init__(self):
-        self.__registry: dict[str, T] = {}
+        The storage lives on the class rather than on a singleton instance,\
+            registries are emptied by :func:`Singleton.clear` but never show up\
+            in :func:`Singleton.list` or :func:`Singleton.get`.
+        """
+        super().__init_subclass__(**kw)
+        if '__singleton_key__' in cls.__dict__:
+            cls._registry = {}
+            _registry_storages.append(cls._registry)
 
     @classmethod
     def register(cls, name: str, entry: T, *, override: bool = False) -> bool:
@@ -128,25 +155,72 @@ class TRegistry[T](Singleton):
         :return: whether registering was successful.
         :rtype: bool
         """
-        instance = cls()
+        if not override and name in cls._registry:
+            cls._warn_registered(name, entry)
+            return False
+        cls._registry[name] = entry
+        return True
+
+    @classmethod
+    def register_many(
+        cls,
+        entries: dict[str, T] | Iterable[tuple[str, T]],
+        *,
+        override: bool = False,
+    ) -> bool:
+        """
+        Register multiple objects into this registry at once.
+
+        Behaves as calling :func:`~.register` for every entry.
+
+        :param entries: mapping or pairs of names and objects to register
+        :type entries: dict[str, T] | Iterable[tuple[str, T]]
+        :param override: whether to allow override existing values, defaults to False
+        :type override: bool, optional
+        :return: whether all entries were registered successfully.
+        :rtype: bool
+        """
+        registry = cls._registry
+        if override:
+            registry.update(entries)
+            return True
+        if isinstance(entries, dict):
+            entries = entries.items()
+        registered = True
+        for name, entry in entries:
+            if name in registry:
+                cls._warn_registered(name, entry)
+                registered = False
+                continue
+            registry[name] = entry
+        return registered
+
+    @classmethod
+    def _warn_registered(cls, name: str, entry: T) -> None:
+        """
+        Log a warning for an entry that is already registered under `name`.
+
+        :param name: name the entry was attempted to be registered as
+        :type name: str
+        :param entry: the rejected entry
+        :type entry: T
+        """
+        if not logger.isEnabledFor(logging.WARNING):
+            # repr on some entries (eg. pygame.Surface) is not free
+            return
         if isinstance(entry, type):
             entryclass = entry.__name__
         else:
             entryclass = entry.__class__.__name__
-
-        if not override and name in instance.__registry:
-            # turns out pygame.Surface has no fucking __name__
-            obj = instance.__registry[name]
-            logger.warning(
-                'Registry[%s]: %s[%s] already registered as %s',
-                cls.__singleton_key__,
-                name,
-                entryclass,
-                getattr(obj, '__name__', repr(obj)),
-            )
-            return False
-        instance.__registry[name] = entry
-        return True
+        # turns out pygame.Surface has no fucking __name__
+        obj = cls._registry[name]
+        logger.warning(
+            'Registry[%s]: %s[%s] already registered as %s',
+            cls.__singleton_key__,
+            name,
+            entryclass,
+            getattr(obj, '__name__', repr(obj)),
+        )
 
     @classmethod
     def get(cls, name: str) -> T | None:
@@ -160,15 +234,15 @@ class TRegistry[T](Singleton):
         :return: object registered under the key or None if not found
         :rtype: T | None
         """
-        instance = cls()
-        if not instance.has(name):
+        entry = cls._registry.get(name, _MISSING)
+        if entry is _MISSING:
             logger.error(
                 "Registry[%s]: Failed to load '%s'",
                 cls.__singleton_key__,
                 name,
             )
             return None
-        return instance.__registry[name]
+        return entry
 
     @classmethod
     def get_typed[U](cls, name: str, expect_type: U) -> U | None:
@@ -202,8 +276,7 @@ class TRegistry[T](Singleton):
         :return: whether an object with `name` is found
         :rtype: bool
         """
-        instance = cls()
-        return name in instance.__registry
+        return name in cls._registry
 
     @classmethod
     def list(cls) -> list[str]:
@@ -213,14 +286,12 @@ class TRegistry[T](Singleton):
         :return: list (name) of all registered objects
         :rtype: list[str]
         """
-        instance = cls()
-        return list(instance.__registry.keys())
+        return list(cls._registry.keys())
 
     @classmethod
     def clear(cls) -> None:
         """Clear the registry."""
-        instance = cls()
-        instance.__registry = {}
+        cls._registry.clear()
 
 
 __all__ = [
@@ -19,7 +19,7 @@ class PygameGuiUIManager(TUIManager):
         self.size: tuple[int, int]
 
     def update(self, dt: int) -> None:
-        self.manager.update(dt / 1000)
+        self.manager.update(dt * 0.001)
 
     def draw_ui(self, render_surface: pygame.Surface) -> None:
         self.manager.draw_ui(render_surface)
@@ -1,17 +1,20 @@
 from collections.abc import Iterable
+from operator import attrgetter
 
 import pygame
 
 from pg_engine.utils import apply_transform
 
 from .config import TRendererConfig
-from .lib_abstract import TGame, TGameObject, TGlobalCamera, TRenderable, TRenderer
+from .lib_abstract import TGame, TGlobalCamera, TRenderable, TRenderer
+
+_layer_of = attrgetter('layer')
 
 
 class BaseRenderer(TRenderer):
     def __init__(self):
         super().__init__()
-        self.cache: dict[TGameObject, list[TRenderable]] = {}
+        self.cache: list[TRenderable] = []
         self.cached_scene = None
 
     def update(self, dt: int) -> None:
@@ -20,14 +23,17 @@ class BaseRenderer(TRenderer):
     def render(self) -> None:
         self.update_cache()
         self.clear()
+        # the camera does not move while rendering a frame
+        camera_offset = tuple(-axis for axis in TGlobalCamera().position)
+        blit = self.render_surface.blit
         for render_obj in self.cache:
             # pos is parenthesised here because it captures an iterable; could be tuple
             surface, (pos), mode = render_obj.get_render_data()
             if not surface:
                 continue
-            self.render_surface.blit(
+            blit(
                 surface,
-                tuple(self.apply_camera(pos)),
+                apply_transform(pos, camera_offset),
                 special_flags=mode,
             )
 
@@ -59,7 +65,7 @@ class BaseRenderer(TRenderer):
                 continue
             self.cache += renderable
         self.cached_scene = scene_name
-        self.cache.sort(key=lambda x: x.layer)
+        self.cache.sort(key=_layer_of)
 
 
 __all__ = [
@@ -9,20 +9,22 @@ from .lazy_proxy import Proxy
 
 from pg_engine.core.bases import Initializer, ClassRegistry
 
-for to_register in [
-    GameConfigLoader,
-    GameObjectBuilder,
-    GameObjectLoader,
-    ScriptLoader,
-    SpriteLoader,
-    YamlLoader,
-    DummyUIManager,
-    DummyUILoader,
-]:
-    Initializer.add_hooks(
-        lambda c=to_register: ClassRegistry.register(c),
-        None,
-    )
+Initializer.add_hooks(
+    lambda: ClassRegistry.register_many({
+        c.__name__: c
+        for c in [
+            GameConfigLoader,
+            GameObjectBuilder,
+            GameObjectLoader,
+            ScriptLoader,
+            SpriteLoader,
+            YamlLoader,
+            DummyUIManager,
+            DummyUILoader,
+        ]
+    }),
+    None,
+)
 
 __all__ = [
     'DummyUILoader',
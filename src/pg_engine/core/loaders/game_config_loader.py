@@ -22,6 +22,16 @@ from .yaml_loader import YamlLoader
 
 logger = logging.getLogger(__name__)
 
+_REQUIRED_ROOT_KEYS = frozenset({
+    'game',
+    'display',
+    'sprites',
+    'scripts',
+    'objects',
+    'ui',
+})
+_REQUIRED_LOADABLE_KEYS = frozenset({'loader', 'config'})
+
 
 class GameConfigLoader(YamlLoader):
 
@@ -46,24 +56,13 @@ class GameConfigLoader(YamlLoader):
         :return: Whether all required keys are present
         :rtype: bool
         """
-        requires = [
-            'game',
-            'display',
-            'sprites',
-            'scripts',
-            'objects',
-            'ui',
-        ]
-        valid = True
-        for key in requires:
-            if key in config:
-                continue
-            valid = False
+        missing = _REQUIRED_ROOT_KEYS.difference(config)
+        for key in sorted(missing):
             logger.critical(
                 "Config: missing configuration '%s'",
                 key,
             )
-        return valid
+        return not missing
 
     @classmethod
     def _validate_keys(cls, key: str, conf: TLoadableConfig) -> bool:
@@ -77,17 +76,14 @@ class GameConfigLoader(YamlLoader):
         :return: Whether all required keys are present
         :rtype: bool
         """
-        requires = ('loader', 'config')
-        valid_config = True
-        for req in requires:
-            if req not in conf:
-                logger.critical(
-                    "Config: %s missing key '%s'",
-                    key,
-                    req,
-                )
-                valid_config = False
-        return valid_config
+        missing = _REQUIRED_LOADABLE_KEYS.difference(conf)
+        for req in sorted(missing):
+            logger.critical(
+                "Config: %s missing key '%s'",
+                key,
+                req,
+            )
+        return not missing
 
     @classmethod
     def _validate_config_objects(
@@ -19,6 +19,9 @@ from .yaml_loader import YamlLoader
 
 logger = logging.getLogger(__name__)
 
+# registry contents are cleared in place, the bound lookup stays valid
+_get_class = ClassRegistry.get
+
 
 class GameObjectBuilder(TGameObjectBuilder):
     def build(self, name: str, definition: TGameObjectConfig) -> TGameObject:
@@ -33,7 +36,8 @@ class GameObjectBuilder(TGameObjectBuilder):
             **self.builder_kw,
         )
         ComponentBuilder.attach_components(go, definition.get('components', []))
-        TGame().scenes[scene].add_gameobject(go)
+        scenes = self.scenes if self.scenes is not None else TGame().scenes
+        scenes[scene].add_gameobject(go)
         return go
 
 
@@ -58,9 +62,10 @@ class ComponentBuilder:
         :param components: list of component definitions
         :type components: list[TComponentConfig]
         """
+        create_component = cls.create_component
+        add_component = gameobject.components.add
         for component_def in components:
-            refname, component = cls.create_component(component_def, gameobject)
-            gameobject.components.add(refname, component)
+            add_component(*create_component(component_def, gameobject))
 
     @classmethod
     def create_component(
@@ -78,10 +83,11 @@ class ComponentBuilder:
         :return: name (from refname) or type of the component and the constructed component
         :rtype: tuple[str, TComponent]
         """  # noqa: E501
+        get = component_def.get
         c_type = component_def['type']
-        refname = component_def.get('refname', c_type)
-        args = component_def['args'] or {}
-        component_class: type[TComponent] | None = ClassRegistry.get(c_type)
+        refname = get('refname') or c_type
+        args = get('args') or {}
+        component_class: type[TComponent] | None = _get_class(c_type)
         if not component_class:
             logger.critical(
                 'Component[%s]: Could not find registry entry',
@@ -110,15 +116,22 @@ class GameObjectLoader(YamlLoader):
         """
         data: dict[str, TGameObjectConfig] = super().load()
         loaded = {}
-        for name, definition in data.items():
-            if definition.get('prefab'):
-                del definition['prefab']
-                self.register_loaded(name, definition, registry=PrefabRegistry)
-                continue
-            game_object = TGame().objectbuilder.build(
-                name=name,
-                definition=definition,
-            )
-            self.register_loaded(name, game_object)
-            loaded[name] = game_object
+        game = TGame()
+        builder = game.objectbuilder
+        builder.bind(game)
+        build = builder.build
+        try:
+            for name, definition in data.items():
+                if definition.pop('prefab', False):
+                    self.register_loaded(name, definition, registry=PrefabRegistry)
+                    continue
+                game_object = build(
+                    name=name,
+                    definition=definition,
+                )
+                self.register_loaded(name, game_object)
+                loaded[name] = game_object
+        finally:
+            # spawning later on should not keep using these scenes
+            builder.bind(None)
         return loaded
@@ -29,6 +29,7 @@ class env_cached_property:  # noqa: N801 no, because it's a decorator
         :type func: Callable
         """
         self.func = func
+        self.name: str = func.__name__
 
     def __get__(self, instance: Any, _: Any) -> Any:  # noqa: ANN401
         """
@@ -48,10 +49,16 @@ class env_cached_property:  # noqa: N801 no, because it's a decorator
             return self
         value = self.func(instance)
         if ContextRegistry.get_context('evaluate_lazy') != False:  # noqa: E712 True default for None
-            instance.__dict__[self.func.__name__] = value
+            instance.__dict__[self.name] = value
         return value
 
 
+# descriptor of the unpatched proxy, bound once instead of resolved through
+# super() on every access. works for the c extension's getset descriptor as well
+# as the (cached) properties of the pure python proxies
+_wrapped_get = _Proxy.__wrapped__.__get__
+
+
 # small patch to proxy to keep context
 class Proxy(_Proxy):
 
@@ -61,4 +68,4 @@ class Proxy(_Proxy):
     def __wrapped__(self):  # noqa: PLW3201 inherited from _Proxy
         if ContextRegistry.get_context('evaluate_lazy') == False:  # noqa: E712 True default for None
             return None
-        return super().__wrapped__
+        return _wrapped_get(self, _Proxy)
@@ -17,11 +17,13 @@ class PygameGuiUILoader(UILoader[UIElement]):
     """Implementation of :class:`UILoader` to load pygame_gui UIs."""
 
     def init_scenes(self) -> None:
-        manager = TUIManager().manager
+        uimanager = TUIManager()
+        manager = uimanager.manager
+        size = uimanager.size
         for scene in TGame().scenes:
             container = UIContainer(
                 manager=manager,
-                relative_rect=pygame.Rect(0, 0, *TUIManager().size),
+                relative_rect=pygame.Rect(0, 0, *size),
             )
             self.register_loaded(scene, container)
 
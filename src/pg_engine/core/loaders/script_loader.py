@@ -1,5 +1,6 @@
 import importlib
 import logging
+import pkgutil
 from pathlib import Path
 from types import ModuleType
 
@@ -22,18 +23,14 @@ class ScriptLoader(TLoader):
         :rtype: dict[str, TScript]
         """  # noqa: E501
         loaded: dict[str, TScript] = {}
-        p = Path(self.root / self.filename)
-        for file in p.iterdir():
-            if file.stem.startswith('__') and file.stem != '__init__':
-                continue
-            scriptfile: Path = p / file.stem
-            module_path = str(
-                scriptfile.as_posix(),
-            ).replace(
-                # trimming because we get some wack paths otherwise
-                str(self.root.as_posix()) + '/',
-                '',
-            ).replace('/', '.')
+        package = '.'.join(Path(self.filename).parts)
+        module_paths = [package]
+        module_paths.extend(
+            f'{package}.{module_info.name}'
+            for module_info in pkgutil.iter_modules([str(self.root / self.filename)])
+            if not module_info.name.startswith('__')
+        )
+        for module_path in module_paths:
             module = importlib.import_module(module_path)
             exported = self.export_module(module)
             for export_key, export in exported:
@@ -70,7 +67,9 @@ class ScriptLoader(TLoader):
         # from this module we use a list
         # instead of joining loaded | exported
         exports: list[tuple[str, TScript]] = []
-        module_all = module.__all__ if hasattr(module, '__all__') else dir(module)
+        module_all = getattr(module, '__all__', None)
+        if module_all is None:
+            module_all = dir(module)
         for entry in module_all:
             module_entry = getattr(module, entry)
             if (
@@ -78,8 +77,7 @@ class ScriptLoader(TLoader):
                 or not issubclass(module_entry, TScript)
             ):
                 continue
-            if hasattr(module_entry, '__exports__') and bool(module_entry.__exports__):
-                exports.append(
-                    (module_entry.__exports__, module_entry),
-                )
+            exported = getattr(module_entry, '__exports__', None)
+            if exported:
+                exports.append((exported, module_entry))
         return exports
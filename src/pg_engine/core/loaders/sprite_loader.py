@@ -1,4 +1,5 @@
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
 import pygame
 
@@ -9,6 +10,8 @@ from .yaml_loader import YamlLoader
 
 logger = logging.getLogger(__name__)
 
+_REQUIRED_SHEET_KEYS = frozenset({'filename', 'width', 'height', 'rect', 'bindings'})
+
 
 class SpriteLoader(YamlLoader):
 
@@ -36,45 +39,65 @@ class SpriteLoader(YamlLoader):
         :return: whether the data is valid.
         :rtype: bool
         """
-        valid = True
-        for key in ('filename', 'width', 'height', 'rect', 'bindings'):
-            if key not in sheet_data:
-                logger.error("Spritesheet[%s]: key '%s' not found", name, key)
-                valid = False
-                continue
-            if sheet_data[key] is None:
-                logger.error("Spritesheet[%s]: key '%s' cannot be empty", name, key)
-                valid = False
-        return valid
-
-    def load_sheet(self, sheet_data: TSpriteConfig) -> list[pygame.Surface]:
+        missing = _REQUIRED_SHEET_KEYS.difference(sheet_data)
+        for key in sorted(missing):
+            logger.error("Spritesheet[%s]: key '%s' not found", name, key)
+        empty = sorted(
+            key for key in _REQUIRED_SHEET_KEYS.difference(missing)
+            if sheet_data[key] is None
+        )
+        for key in empty:
+            logger.error("Spritesheet[%s]: key '%s' cannot be empty", name, key)
+        return not missing and not empty
+
+    def load_sheet(
+        self,
+        sheet_data: TSpriteConfig,
+        sheet: SpriteSheet | None = None,
+    ) -> list[pygame.Surface]:
         """
         Load a single spritesheet's content.
 
+        .. note::
+            sprites of spritesheets with `share_pixels` set and without a colorkey\
+            are views into the spritesheet (see :func:`SpriteSheet.image_view`),\
+            copy them before drawing on them.
+
         :param sheet_data: configuration data of the spritesheet
         :type sheet_data: dict
+        :param sheet: already opened spritesheet image, defaults to None
+        :type sheet: SpriteSheet | None, optional
         :return: list of loaded sprites
         :rtype: list[pygame.Surface]
         """
-        sheet = SpriteSheet(sheet_data['filename'], root=self.root)
-        rect = sheet_data['rect']
-        width = sheet_data['width']
-        height = sheet_data['height']
+        if sheet is None:
+            sheet = self.open_sheet(sheet_data)
+        x, y, w, h = sheet_data['rect']
         colorkey = sheet_data.get('colorkey', self.colorkey)
         sheet.set_colorkey(colorkey)
+        # offsets are shared by every row/column, compute them once per sheet
+        columns = [x + w * col for col in range(sheet_data['width'])]
+        rows = [y + h * row for row in range(sheet_data['height'])]
+        # opt in, views keep the alpha of the sheet
+        share_pixels = sheet_data.get('share_pixels', False) and sheet.colorkey is None
+        image_at = sheet.image_view if share_pixels else sheet.image_at
         return [
-            sheet.image_at(
-                [
-                    rect[0] + rect[2] * col,
-                    rect[1] + rect[3] * row,
-                    rect[2],
-                    rect[3],
-                ],
-            )
-            for row in range(height)
-            for col in range(width)
+            image_at((col_x, row_y, w, h))
+            for row_y in rows
+            for col_x in columns
         ]
 
+    def open_sheet(self, sheet_data: TSpriteConfig) -> SpriteSheet:
+        """
+        Open the image of a spritesheet configuration.
+
+        :param sheet_data: configuration data of the spritesheet
+        :type sheet_data: dict
+        :return: the opened spritesheet
+        :rtype: SpriteSheet
+        """
+        return SpriteSheet(sheet_data['filename'], root=self.root)
+
     def load(self) -> dict[str, pygame.Surface]:
         """
         Load and register all sprites from all spritesheets.
@@ -86,10 +109,15 @@ class SpriteLoader(YamlLoader):
         """
         data: dict[str, TSpriteConfig] = super().load()
         loaded = {}
-        for spritesheet, conf in data.items():
-            if not self.validate_sheet_keys(spritesheet, conf):
-                continue
-            sprites = self.load_sheet(conf)
+        confs = [
+            conf for spritesheet, conf in data.items()
+            if self.validate_sheet_keys(spritesheet, conf)
+        ]
+        # image decoding releases the GIL, open all sheets concurrently
+        with ThreadPoolExecutor() as executor:
+            sheets = list(executor.map(self.open_sheet, confs))
+        for conf, sheet in zip(confs, sheets, strict=True):
+            sprites = self.load_sheet(conf, sheet)
             for binding, sprite in zip(conf['bindings'], sprites, strict=True):
                 if not binding:
                     continue
@@ -99,6 +127,6 @@ class SpriteLoader(YamlLoader):
                         binding,
                     )
                     continue
-                self.register_loaded(binding, sprite)
                 loaded[binding] = sprite
+        self.registry.register_many(loaded)
         return loaded
@@ -30,6 +30,10 @@ class SpriteSheet:
             logger.exception('Unable to load spritesheet image: %s', filename)
             sys.exit(ExitCodes.EXIT_CODE_LOAD_SPRITESHEET)
         self.colorkey = None
+        #: whether the colorkey still has to be read from the first sprite (-1)
+        self._colorkey_from_pixel = False
+        # reused by image_at, never handed out
+        self._scratch_rect = pygame.Rect(0, 0, 0, 0)
 
     # Load a specific image from a specific rectangle
     def image_at(
@@ -44,15 +48,46 @@ class SpriteSheet:
         :return: the image data at rectangle as a surface with :func:`convert_alpha`.
         :rtype: pygame.Surface
         """
-        rect = pygame.Rect(rectangle)
-        image = pygame.Surface(rect.size).convert_alpha()
+        rect = self._scratch_rect
+        rect.update(rectangle)
+        # created in the pixel format of the already converted sheet
+        image = pygame.Surface(rect.size, pygame.SRCALPHA, self.sheet)
+        image.fill((0, 0, 0))
         image.blit(self.sheet, (0, 0), rect)
-        if self.colorkey is not None:
-            if self.colorkey == -1:
-                self.colorkey = image.get_at((0, 0))
-            image.set_colorkey(self.colorkey, pygame.RLEACCEL)
+        colorkey = self.colorkey
+        if colorkey is None:
+            return image
+        if self._colorkey_from_pixel:
+            colorkey = self.colorkey = image.get_at((0, 0))
+            self._colorkey_from_pixel = False
+        image.set_colorkey(colorkey, pygame.RLEACCEL)
+        # bakes the colorkey into per pixel alpha
         return image.convert_alpha()
 
+    def image_view(
+        self,
+        rectangle: pygame.Rect | tuple[int, int, int, int],
+        ) -> pygame.Surface:
+        """
+        Get a view into this spritesheet at `rectangle`.
+
+        Unlike :func:`image_at` no pixels are copied, the returned surface shares
+        its pixels with the spritesheet, as such no colorkey is applied and the\
+            alpha of the spritesheet is kept instead of being filled opaque black.
+        `rectangle` is clipped to the spritesheet.
+
+        .. warning::
+            drawing on the returned surface draws on the spritesheet,
+            use :func:`pygame.Surface.copy` before mutating it.
+
+        :param rectangle: x,y, width, heigth of the image to get
+        :type rectangle: pygame.Rect | tuple[int, int, int, int]
+        :return: subsurface of the spritesheet at rectangle
+        :rtype: pygame.Surface
+        """
+        sheet = self.sheet
+        return sheet.subsurface(pygame.Rect(rectangle).clip(sheet.get_rect()))
+
     @classmethod
     def rect_for(cls, rect_def: tuple[int, int, int, int]) -> pygame.Rect:
         """
@@ -77,7 +112,9 @@ class SpriteSheet:
         """
         if colorkey is None or colorkey == -1:
             self.colorkey = colorkey
+            self._colorkey_from_pixel = colorkey is not None
             return
+        self._colorkey_from_pixel = False
         if isinstance(colorkey, pygame.Color):
             self.colorkey = colorkey
             return
@@ -14,6 +14,29 @@ from .yaml_loader import YamlLoader
 
 logger = logging.getLogger(__name__)
 
+_OPTIONAL_UI_KEYS = frozenset({'anchors', 'args'})
+_REQUIRED_UI_KEYS = frozenset({'classpath', 'size', 'offset'})
+
+#: ui element classes by classpath, shared by all ui loaders
+_class_cache: dict[str, type] = {}
+
+
+def resolve_classpath(classpath: str) -> type:
+    """
+    Import a class from it's full dotted path.
+
+    :param classpath: dotted path of the class (eg. `pygame_gui.elements.UIButton`)
+    :type classpath: str
+    :return: the class found at `classpath`
+    :rtype: type
+    """
+    object_class = _class_cache.get(classpath)
+    if object_class is None:
+        module_name, class_name = classpath.rsplit('.', 1)
+        module: ModuleType = importlib.import_module(module_name)
+        object_class = _class_cache[classpath] = getattr(module, class_name)
+    return object_class
+
 
 class TUIContainer:
 
@@ -40,23 +63,20 @@ class UILoader[T](YamlLoader, ABC):
         :return: whether the configuration is valid
         :rtype: bool
         """
-        valid = True
-        for key in ('anchors', 'args'):
-            if key not in config:
-                logger.warning(
-                    "UIConfig: missing configuration key '%s' on '%s'",
-                    key,
-                    element,
-                )
-        for key in ('classpath', 'size', 'offset'):
-            if key not in config:
-                valid = False
-                logger.error(
-                    "UIConfig: missing configuration key '%s' on '%s'",
-                    key,
-                    element,
-                )
-        return valid
+        for key in sorted(_OPTIONAL_UI_KEYS.difference(config)):
+            logger.warning(
+                "UIConfig: missing configuration key '%s' on '%s'",
+                key,
+                element,
+            )
+        missing = _REQUIRED_UI_KEYS.difference(config)
+        for key in sorted(missing):
+            logger.error(
+                "UIConfig: missing configuration key '%s' on '%s'",
+                key,
+                element,
+            )
+        return not missing
 
     @classmethod
     @abstractmethod
@@ -101,9 +121,7 @@ class UILoader[T](YamlLoader, ABC):
             if not self._validate_configs(key, conf or {}):
                 continue
 
-            module_name, class_name = conf['classpath'].rsplit('.', 1)
-            module: ModuleType = importlib.import_module(module_name)
-            object_class: type[T] = getattr(module, class_name)
+            object_class: type[T] = resolve_classpath(conf['classpath'])
 
             try:
                 relative_rect = pygame.rect.Rect(conf['offset'] + conf['size'])
@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+import functools
+import logging
 import pathlib
 from collections.abc import Callable
-from typing import Any
+from types import CodeType
+from typing import Any, ClassVar
 
 import yaml
-from yaml.nodes import Node
+from yaml.events import StreamEndEvent
+from yaml.nodes import MappingNode, Node, ScalarNode
 
 from pg_engine.core import (
     ClassRegistry,
@@ -19,21 +23,38 @@ from .lazy_proxy import Proxy
 
 BASE_PATH = pathlib.Path(__file__).parent.parent.parent.parent
 
+logger = logging.getLogger(__name__)
 
-def get_factory_method(registry: TRegistry, proxy: str) -> Callable:
+#: composed included files by loader class and file path,
+#: stored together with the (mtime, size) stamp of the file they were read from
+_included: dict[tuple, tuple[tuple, Node | None]] = {}
+
+
+@functools.lru_cache(maxsize=1024)
+def compile_formula(formula: str) -> CodeType:
+    """
+    Compile a formatted `!calc` formula, repeated formulas are compiled only once.
+
+    :param formula: python expression
+    :type formula: str
+    :return: code object evaluating the expression
+    :rtype: CodeType
+    """
+    return compile(formula, '<calc>', 'eval')
+
+
+def get_factory_method(registry: type[TRegistry], proxy: str) -> Callable:
     """
     Create a factory method for lazy loader.
 
     :param registry: registry to load from
-    :type registry: TRegistry
+    :type registry: type[TRegistry]
     :param proxy: name of the object being proxied
     :type proxy: str
     :return: factory method used by :class:`Proxy`
     :rtype: Callable
     """
-    def factory_method[T]() -> T:
-        return registry.get(proxy)
-    return factory_method
+    return functools.partial(registry.get, proxy)
 
 
 class ConsumeRefs(yaml.Loader):
@@ -84,8 +105,16 @@ class YamlConstructors(ConsumeRefs):
             raise RuntimeError(message)
 
         filename = self.construct_scalar(node)
-        with open(self.root / filename) as f:
-            return yaml.load(f, YamlConstructors)  # noqa: S506
+        consume_refs = bool(ContextRegistry.get_context('extra_anchors'))
+        loader_class = get_loader_class(consume_refs=consume_refs)
+        path = self.root / filename
+        if consume_refs:
+            # composing depends on the anchors of the including file
+            return yaml.load(path.read_bytes(), loader_class)  # noqa: S506
+        included = compose_include(loader_class, path)
+        if included is None:
+            return None
+        return loader_class('').construct_document(included)
 
     def lazy(self, node: Node) -> Proxy:
         """
@@ -103,7 +132,7 @@ class YamlConstructors(ConsumeRefs):
         :rtype: :class:`~.base_library.core.loaders.Proxy`
         """
         mapping = self.construct_mapping(node)
-        reg: TRegistry = ClassRegistry.get(mapping['target_registry'])()
+        reg: type[TRegistry] = ClassRegistry.get(mapping['target_registry'])
         factory = get_factory_method(reg, mapping['proxies'])
 
         return Proxy(factory)
@@ -139,7 +168,7 @@ class YamlConstructors(ConsumeRefs):
         """
         mapping = self.construct_mapping(node, deep=True)
         formula = mapping['formula'].format(*mapping['vars'])
-        return eval(formula)  # noqa: S307
+        return eval(compile_formula(formula))  # noqa: S307
         # game config data is assumed to be safe
         # if not then the developer of this game shouldn't have to go through here
         # in the first place
@@ -178,27 +207,110 @@ class YamlConstructors(ConsumeRefs):
         :return: Class as found in the registry
         :rtype: type
         """
-        if isinstance(node, yaml.nodes.MappingNode):
+        if isinstance(node, MappingNode):
             initnode = self.construct_mapping(node, deep=True)
             cls = ClassRegistry.get(initnode['type'])
             return cls(**initnode['args'])
-        if isinstance(node, yaml.nodes.ScalarNode):
+        if isinstance(node, ScalarNode):
             initnode = self.construct_scalar(node)
             return ClassRegistry.get(initnode)()
         return None
 
 
-YamlConstructors.add_constructor('!include', YamlConstructors.include)
-YamlConstructors.add_constructor('!lazy', YamlConstructors.lazy)
-YamlConstructors.add_constructor('!calc', YamlConstructors.calc)
-YamlConstructors.add_constructor('!classinit', YamlConstructors.classinit)
-YamlConstructors.add_constructor('!classget', YamlConstructors.classget)
+if yaml.__with_libyaml__:
+    class CYamlConstructors(yaml.CLoader):
+
+        """
+        :class:`YamlConstructors` backed by libyaml.
+
+        The C parser composes nodes natively and therefore cannot consume extra\
+            anchors, see :func:`get_loader_class`.
+        """
+
+        def __init__(self, stream: yaml._ReadStream, root: None = None):
+            super().__init__(stream)
+            self.root = root
+
+        include = YamlConstructors.include
+        lazy = YamlConstructors.lazy
+        calc = YamlConstructors.calc
+        classget = YamlConstructors.classget
+        classinit = YamlConstructors.classinit
+else:
+    CYamlConstructors = None
+
+logger.debug(
+    'YamlLoader: using %s parser',
+    'libyaml' if CYamlConstructors else 'pure python',
+)
+
+for constructors in (YamlConstructors, CYamlConstructors):
+    if constructors is None:
+        continue
+    constructors.add_constructor('!include', constructors.include)
+    constructors.add_constructor('!lazy', constructors.lazy)
+    constructors.add_constructor('!calc', constructors.calc)
+    constructors.add_constructor('!classinit', constructors.classinit)
+    constructors.add_constructor('!classget', constructors.classget)
+
+
+def compose_include(
+    loader_class: type[YamlConstructors],
+    path: pathlib.Path,
+) -> Node | None:
+    """
+    Parse an included file into a node graph, reusing it while the file is unchanged.
+
+    :param loader_class: loader used for parsing
+    :type loader_class: type[YamlConstructors]
+    :param path: path of the included file
+    :type path: pathlib.Path
+    :return: root node of the included document
+    :rtype: Node | None
+    """
+    stat = path.stat()
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    key = (loader_class, path)
+    cached = _included.get(key)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    loader = loader_class(path.read_bytes())
+    try:
+        included = loader.get_single_node()
+    finally:
+        loader.dispose()
+    _included[key] = (stamp, included)
+    return included
+
+
+def get_loader_class(*, consume_refs: bool) -> type[YamlConstructors]:
+    """
+    Get the fastest loader class able to load a file.
+
+    :param consume_refs: whether the loader has to consume extra anchors
+    :type consume_refs: bool
+    :return: libyaml backed constructors if available and no extra anchors have\
+        to be consumed, :class:`YamlConstructors` otherwise
+    :rtype: type[YamlConstructors]
+    """
+    if consume_refs or CYamlConstructors is None:
+        return YamlConstructors
+    return CYamlConstructors
 
 
 class YamlLoader(TLoader):
 
     """Base class for loaders that load in a yaml file format."""
 
+    #: composed documents and their extra anchors by loader class and file paths,
+    #: stored together with the (mtime, size) stamps of the files they were read from
+    _documents: ClassVar[
+        dict[tuple, tuple[tuple, Node | None, dict[str, Node]]]
+    ] = {}
+    #: anchors of reference files by loader class and file path,
+    #: stored together with the (mtime, size) stamp of the file they were read from
+    _anchors: ClassVar[dict[tuple, tuple[tuple, dict[str, Node]]]] = {}
+
     def __init__(
         self,
         filename: str,
@@ -228,16 +340,52 @@ class YamlLoader(TLoader):
         """
         Load data from a file, optionally using external references.
 
+        Parsing is skipped when neither the file nor its references changed since\
+            they were last loaded, constructing the data always happens anew.
+
         :return: loaded data in standardized dict[str, any] format
         :rtype: dict[str, Any]
         """
-        with open(self.root / self.filename) as f:
-            loader = YamlConstructors(f, root=self.root)
-            anchors = {}
-            for ref in self.useref:
-                anchors |= self._load_refs(ref, loader)
-            with Context(extra_anchors=anchors, include_fileroot=str(self.root)):
-                return loader.get_single_data()
+        loader_class = get_loader_class(consume_refs=bool(self.useref))
+        paths = tuple(self.root / file for file in (self.filename, *self.useref))
+        stamps = tuple((stat.st_mtime_ns, stat.st_size) for stat in (
+            path.stat() for path in paths
+        ))
+        key = (loader_class, *paths)
+        document = self._documents.get(key)
+        if document is None or document[0] != stamps:
+            document = (stamps, *self._compose(loader_class))
+            self._documents[key] = document
+        else:
+            logger.debug('YamlLoader: reusing parsed %s', self.filename)
+        _, node, anchors = document
+        if node is None:
+            return None
+        loader = loader_class('', root=self.root)
+        with Context(extra_anchors=anchors, include_fileroot=str(self.root)):
+            return loader.construct_document(node)
+
+    def _compose(
+        self,
+        loader_class: type[YamlConstructors],
+    ) -> tuple[Node | None, dict[str, Node]]:
+        """
+        Parse this loader's file into a node graph.
+
+        :param loader_class: loader used for parsing
+        :type loader_class: type[YamlConstructors]
+        :return: root node of the document and the extra anchors it may use
+        :rtype: tuple[Node | None, dict[str, Node]]
+        """
+        loader = loader_class((self.root / self.filename).read_bytes(), root=self.root)
+        anchors = {}
+        for ref in self.useref:
+            anchors |= self._load_refs(ref, loader)
+        with Context(extra_anchors=anchors):
+            try:
+                return loader.get_single_node(), anchors
+            finally:
+                loader.dispose()
 
     def _load_refs(self, ref_path: str, loader: ConsumeRefs) -> dict[str, Node]:
         """
@@ -250,12 +398,19 @@ class YamlLoader(TLoader):
         :return: raw references as used by :class:`yaml.Loader` subclasses
         :rtype: dict[str, Node]
         """
-        with open(self.root / ref_path) as f:
-            new_loader = loader.__class__(f, root=self.root)
+        path = self.root / ref_path
+        stat = path.stat()
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        key = (loader.__class__, path)
+        cached = self._anchors.get(key)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        new_loader = loader.__class__(path.read_bytes(), root=self.root)
         new_loader.get_event()
-        if not new_loader.check_event(yaml.events.StreamEndEvent):
+        if not new_loader.check_event(StreamEndEvent):
             new_loader.get_event()
             new_loader.compose_node(None, None)
         anchors = new_loader.anchors
         new_loader.dispose()
+        self._anchors[key] = (stamp, anchors)
         return anchors
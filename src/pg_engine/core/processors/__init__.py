@@ -3,14 +3,16 @@ from .graphics_processor import GraphicsProcessor
 
 from pg_engine.core.bases import Initializer, ClassRegistry
 
-for to_register in [
-    GameConfigProcessor,
-    GraphicsProcessor,
-]:
-    Initializer.add_hooks(
-        lambda c=to_register: ClassRegistry.register(c),
-        None,
-    )
+Initializer.add_hooks(
+    lambda: ClassRegistry.register_many({
+        c.__name__: c
+        for c in [
+            GameConfigProcessor,
+            GraphicsProcessor,
+        ]
+    }),
+    None,
+)
 
 __all__ = [
     'GameConfigProcessor',
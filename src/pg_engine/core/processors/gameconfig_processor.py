@@ -27,10 +27,10 @@ class GameConfigProcessor(TProcessor):
         """
         game = TGame()
 
-        for scene in config['scenes']:
-            scene_object = game.scenebuilder.build(scene)
-            game.scenes[scene] = scene_object
-        if 'default' not in game.scenes:
-            game.scenes['default'] = game.scenebuilder.build('default')
+        build = game.scenebuilder.build
+        scenes = game.scenes
+        scenes.update((scene, build(scene)) for scene in config['scenes'])
+        if 'default' not in scenes:
+            scenes['default'] = build('default')
         game.debug_mode = config.get('debug_mode', False)
         game.fps = config.get('fps', 60)
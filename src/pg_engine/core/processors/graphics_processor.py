@@ -2,10 +2,10 @@ from __future__ import annotations
 
 import logging
 from collections.abc import Callable
+from typing import ClassVar
 
 from pg_engine.core import (
     TDisplayConfig,
-    TGame,
     TProcessor,
     TRenderer,
     TRendererConfig,
@@ -24,6 +24,29 @@ class GraphicsProcessor(TProcessor):
     :class:`TUIManager` and :class:`TRenderer`.
     """
 
+    #: `_configure_{x}` methods by configuration key x, collected per class
+    _handlers: ClassVar[dict[str, Callable[[dict], None]]]
+
+    @classmethod
+    def _get_handlers(cls) -> dict[str, Callable[[dict], None]]:
+        """
+        Get the `_configure_{x}` methods of this class by x.
+
+        Collected on first use, subclasses collect their own.
+
+        :return: configuration methods by configuration key
+        :rtype: dict[str, Callable[[dict], None]]
+        """
+        handlers = cls.__dict__.get('_handlers')
+        if handlers is None:
+            prefix = '_configure_'
+            handlers = cls._handlers = {
+                name.removeprefix(prefix): getattr(cls, name)
+                for name in dir(cls)
+                if name.startswith(prefix)
+            }
+        return handlers
+
     @classmethod
     def process(
         cls,
@@ -38,16 +61,16 @@ class GraphicsProcessor(TProcessor):
         :param processor_args: not used, defaults to None
         :type processor_args: None, optional
         """  # noqa: E501
+        handlers = cls._get_handlers()
         for key, conf in config.items():
-            meth = f'_configure_{key}'
-            if not hasattr(cls, meth):
+            processor_meth = handlers.get(key)
+            if processor_meth is None:
                 logger.warning(
-                    "%s: Configuration method '%s' not found",
+                    "%s: Configuration method '_configure_%s' not found",
                     cls.__name__,
-                    meth,
+                    key,
                 )
                 continue
-            processor_meth: Callable[[TGame, dict], None] = getattr(cls, meth)
             processor_meth(conf)
 
     @classmethod
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+from typing import ClassVar
 
 from .constants import LOG_FORMATTER_FORMATS, LOG_TIME_FORMAT
 
@@ -8,12 +9,16 @@ _logger = logging.getLogger('pg_engine')
 
 
 class BaseFormatter(logging.Formatter):
-    def format(self, record: logging.LogRecord) -> str:  # noqa: PLR6301
-        log_fmt = LOG_FORMATTER_FORMATS.get(record.levelno)
-        formatter = logging.Formatter(
-            log_fmt,
-            datefmt=LOG_TIME_FORMAT,
-        )
+    #: formatters by log level, created once and shared by all instances
+    _formatters: ClassVar[dict[int, logging.Formatter]] = {
+        level: logging.Formatter(log_fmt, datefmt=LOG_TIME_FORMAT)
+        for level, log_fmt in LOG_FORMATTER_FORMATS.items()
+    }
+    #: formatter for levels without a format of their own
+    _default_formatter = logging.Formatter(None, datefmt=LOG_TIME_FORMAT)
+
+    def format(self, record: logging.LogRecord) -> str:
+        formatter = self._formatters.get(record.levelno, self._default_formatter)
         return formatter.format(record)
 
     @classmethod
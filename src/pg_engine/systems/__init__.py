@@ -16,16 +16,18 @@ from .collision_system import (
 
 from pg_engine.core.bases import ClassRegistry, Initializer
 
-for to_initialize in [
-    BaseSystemController,
-    EventSystem,
-    CollisionSystem,
-    SystemEventQueue,
-]:
-    Initializer.add_hooks(
-        lambda c=to_initialize: ClassRegistry.register(c),
-        None,
-    )
+Initializer.add_hooks(
+    lambda: ClassRegistry.register_many({
+        c.__name__: c
+        for c in [
+            BaseSystemController,
+            EventSystem,
+            CollisionSystem,
+            SystemEventQueue,
+        ]
+    }),
+    None,
+)
 
 __all__ = [
     # custom events
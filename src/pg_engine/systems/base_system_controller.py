@@ -16,9 +16,11 @@ class BaseSystemController(TSystemController):
         self.sequence_hooks: list[Callable] = self.get_sequence_hooks()
 
     def update(self, dt: int) -> None:
+        # system events sent by a hook are handled before the next hook runs
+        update_system = self.event_system.update_system
         for hook in self.sequence_hooks:
             hook(dt)
-            self.event_system.update_system(dt)
+            update_system(dt)
 
     def remove_gameobject(self, gameobject: TGameObject) -> None:
         self.event_system.remove_gameobject(gameobject)
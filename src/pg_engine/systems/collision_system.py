@@ -1,7 +1,7 @@
-import functools
 import logging
 from abc import abstractmethod
-from collections.abc import Callable
+from collections import defaultdict
+from collections.abc import Callable, Sequence
 
 import pygame
 
@@ -63,6 +63,58 @@ class CollisionScript(TScript, EventListener):
         self.source.transform.move(self.store_phys, True)
 
 
+type RectEntry = tuple[TColliderComponent, pygame.Rect]
+type RectPair = tuple[TColliderComponent, pygame.Rect, TColliderComponent, pygame.Rect]
+
+
+def sweep_and_prune(
+    first: list[RectEntry],
+    second: list[RectEntry] | None = None,
+) -> list[RectPair]:
+    """
+    Find colliders with overlapping rectangles by sweeping along the x axis.
+
+    Colliders are visited by their left edge, only colliders still spanning\
+        that edge are kept around and compared against.
+
+    :param first: colliders and their rectangles
+    :type first: list[RectEntry]
+    :param second: colliders and their rectangles to pair with those of first,\
+        pairs colliders within first once if not given, defaults to None
+    :type second: list[RectEntry] | None, optional
+    :return: collider and rectangle from first followed by the overlapping\
+        collider and rectangle, for every overlap
+    :rtype: list[RectPair]
+    """
+    pairs: list[RectPair] = []
+    entries = [(rect, collider, True) for collider, rect in first]
+    if second is not None:
+        entries.extend((rect, collider, False) for collider, rect in second)
+    entries.sort(key=lambda entry: entry[0].left)
+    # a single group pairs with itself, otherwise only with the other group
+    active: dict[bool, list[tuple[pygame.Rect, TColliderComponent, bool]]] = {
+        True: [],
+        False: [],
+    }
+    for entry in entries:
+        rect, collider, in_first = entry
+        pair_with = in_first if second is None else not in_first
+        left = rect.left
+        others = active[pair_with] = [
+            other for other in active[pair_with] if other[0].right > left
+        ]
+        colliderect = rect.colliderect
+        for other_rect, other, _ in others:
+            if not colliderect(other_rect):
+                continue
+            if in_first and second is not None:
+                pairs.append((collider, rect, other, other_rect))
+            else:
+                pairs.append((other, other_rect, collider, rect))
+        active[in_first].append(entry)
+    return pairs
+
+
 class CollisionSystem(TCollisionSystem):
     def __init__(self):
         """
@@ -71,10 +123,29 @@ class CollisionSystem(TCollisionSystem):
         contains:
         - dictionary to separate collision layers for more efficient processing
         - a set of interractions to track
+        - filtered groups by layer, physics and active scene reused across frames
+        - the layers of the colliders of every gameobject for removal
         """
         super().__init__()
         self.collision_layers: dict[str, list[TColliderComponent]] = {}
         self.interractions: set[frozenset[str]] = set()
+        self._group_cache: dict[
+            tuple[str, bool, str],
+            tuple[TColliderComponent, ...],
+        ] = {}
+        self._by_gameobject: defaultdict[
+            TGameObject,
+            list[tuple[str, TColliderComponent]],
+        ] = defaultdict(list)
+
+    def invalidate(self) -> None:
+        """
+        Drop all cached collision groups.
+
+        Adding and removing colliders invalidates automatically, call this after\
+            changing a collider's `physics` or the scene of its gameobject.
+        """
+        self._group_cache.clear()
 
     def update(self, dt: int) -> None:
         pass
@@ -85,88 +156,102 @@ class CollisionSystem(TCollisionSystem):
 
         this method is used in this class's :func:`.get_sequence_hooks`
 
+        Every colliding gameobject receives a single event per frame carrying all\
+            gameobjects it collided with as `collisions`, `collides` holds the\
+            first of them.
+
         :param dt: milliseconds since last frame
         :type dt: int
         :param event_type: type of collision
         :type event_type: int
         """
+        physics = IS_PHYSICS.get(event_type, False)
+        # colliding gameobjects by gameobject, every gameobject gets a single event
+        collided: defaultdict[TGameObject, dict[TGameObject, None]] = defaultdict(dict)
+        layers = self.collision_layers
         for interraction in self.interractions:
-            g1, g2, self_group = self.get_groups(
-                interraction,
-                IS_PHYSICS.get(event_type, False),
-            )
-            system_event = IS_PHYSICS.get(event_type, False)
+            if not all(layers.get(layer) for layer in interraction):
+                continue  # no colliders on one of the layers at all
+            g1, g2, self_group = self.get_groups(interraction, physics)
+            if not (g1 and g2):
+                continue  # nothing left in this scene or of this collision type
             # there are reasons to shortcut
             # remove a sprite from a group
             # by setting killa or killb to true
             # currently not implemented
-            collisions: dict[
-                TColliderComponent,
-                list[TColliderComponent],
-            ] = pygame.sprite.groupcollide(
-                g1, g2,
-                False, False,
-                pygame.sprite.collide_mask,
-            )
+            # a layer colliding with itself reports every pair once
+            collisions = self.collide_groups(g1, g2, symmetric=self_group)
 
             for g1_sprite, g2_sprites in collisions.items():
+                backing_g1 = g1_sprite.source
+                collided_g1 = collided[backing_g1]
+                collided_g1.update(dict.fromkeys(
+                    g2_sprite.source for g2_sprite in g2_sprites
+                ))
                 for g2_sprite in g2_sprites:
-                    backing_g1 = g1_sprite.source
-                    backing_g2 = g2_sprite.source
-                    if backing_g1 is backing_g2:
-                        continue  # no collide self if multple colliders on object
-                    self._create_collision_event(
-                        event_type,
-                        g1_sprite,
-                        g2_sprite,
-                        dt,
-                        system_event,
-                    )
-                    if self_group:
-                        continue  # would otherwise duplicate events on same layer
-                    self._create_collision_event(
-                        event_type,
-                        g2_sprite,
-                        g1_sprite,
-                        dt,
-                        system_event,
-                    )
+                    collided[g2_sprite.source][backing_g1] = None
+
+        if not collided:
+            return
+        send = TEventSystem().send
+        for target, collides_with in collided.items():
+            collisions = list(collides_with)
+            send(
+                event_type,
+                [target],
+                {
+                    'collides': collisions[0],
+                    'collisions': collisions,
+                    'dt': dt,
+                },
+                system=physics,
+            )
 
     @staticmethod
-    def _create_collision_event(
-        event_type: int,
-        target: TColliderComponent,
-        collides_with: list[TColliderComponent],
-        dt: int,
-        is_system_event: bool = False,
-    ) -> None:
+    def collide_groups(
+        g1: Sequence[TColliderComponent],
+        g2: Sequence[TColliderComponent],
+        *,
+        symmetric: bool = False,
+    ) -> dict[TColliderComponent, list[TColliderComponent]]:
         """
-        Fire a collision event to be processed by the event system.
-
-        :param event_type: Event for the collision type `COLLISION` or `TRIGGER`
-        :type event_type: int
-        :param target: target to send the event to
-        :type target: TColliderComponent
-        :param collides_with: source of the event
-        :type collides_with: list[TColliderComponent]
-        :param dt: milliseconds since last frame, added to event data
-        :type dt: int
-        :param is_system_event: is a system event, defaults to False
-        :type is_system_event: bool, optional
+        Find colliding colliders between two groups.
+
+        Replacement for :func:`pygame.sprite.groupcollide` using `collide_mask`,\
+            only colliders found by :func:`sweep_and_prune` get their masks\
+            compared, unless both use a 'rect'\
+            :attr:`~TColliderComponent.narrow_phase`.\
+            Colliders of the same gameobject never collide.
+
+        :param g1: colliders to find collisions for
+        :type g1: Sequence[TColliderComponent]
+        :param g2: colliders to collide with
+        :type g2: Sequence[TColliderComponent]
+        :param symmetric: whether g1 and g2 hold the same colliders, in which case\
+            every pair is tested and reported only once, defaults to False
+        :type symmetric: bool, optional
+        :return: every collider in g1 mapped to the colliders in g2 it collides with
+        :rtype: dict[TColliderComponent, list[TColliderComponent]]
         """
-        send_data = [
-            event_type,
-            [target.source],
-            {
-                'collides': collides_with.source,
-                'dt': dt,
-            },
-        ]
-        TEventSystem().send(*send_data, system=is_system_event)
+        if not g2:
+            return {}
+        first = [(sprite, sprite.rect) for sprite in g1]
+        second = None if symmetric else [(target, target.rect) for target in g2]
+
+        collisions: dict[TColliderComponent, list[TColliderComponent]] = {}
+        for sprite, rect, candidate, candidate_rect in sweep_and_prune(first, second):
+            if candidate.source is sprite.source:
+                continue  # no collide self if multple colliders on object
+            if not (sprite.narrow_phase == 'rect' and candidate.narrow_phase == 'rect'):
+                offset = (candidate_rect.x - rect.x, candidate_rect.y - rect.y)
+                if not sprite.mask.overlap(candidate.mask, offset):
+                    continue
+            collisions.setdefault(sprite, []).append(candidate)
+        return collisions
 
     def get_groups(self, interraction: frozenset[str], physics: bool) -> tuple[
-        pygame.sprite.Group,
-        pygame.sprite.Group,
+        tuple[TColliderComponent, ...],
+        tuple[TColliderComponent, ...],
         bool,
     ]:
         is_self_collision = False
@@ -175,23 +260,42 @@ class CollisionSystem(TCollisionSystem):
             interraction = tuple(interraction) * 2
         groups = []
         active_scene = TGame().active_scene
+        cache = self._group_cache
         for layer in interraction:
-            group = pygame.sprite.Group(
-                [
-                    collider
-                    for collider in self.collision_layers.get(layer, [])
-                    if collider.physics == physics
-                    and active_scene == collider.source.scene
-                ],
-            )
+            key = (layer, physics, active_scene)
+            group = cache.get(key)
+            if group is None:
+                self._partition(layer, active_scene)
+                group = cache[key]
             groups.append(group)
         return *groups, is_self_collision
 
+    def _partition(self, layer: str, active_scene: str) -> None:
+        """
+        Cache the groups of both physics and trigger colliders of a layer.
+
+        Both groups are filled in a single pass over the layer, so the triggers\
+            hook finds its group cached after the physics hook missed.
+
+        :param layer: collision layer to split up
+        :type layer: str
+        :param active_scene: scene the colliders' gameobjects must be in
+        :type active_scene: str
+        """
+        by_physics: dict[bool, list[TColliderComponent]] = {True: [], False: []}
+        for collider in self.collision_layers.get(layer, []):
+            if active_scene == collider.source.scene:
+                by_physics[bool(collider.physics)].append(collider)
+        cache = self._group_cache
+        for physics, colliders in by_physics.items():
+            cache[layer, physics, active_scene] = tuple(colliders)
+
     def add(self, collider_component: TColliderComponent, layer: str) -> None:
-        layer_data = self.collision_layers.get(layer, [])
-        if not layer_data:
-            self.collision_layers[layer] = layer_data
-        layer_data.append(collider_component)
+        self.collision_layers.setdefault(layer, []).append(collider_component)
+        self._by_gameobject[collider_component.source].append(
+            (layer, collider_component),
+        )
+        self.invalidate()
 
     def enable_collision(self, layer1: str, layer2: str) -> None:
         self.interractions.add(
@@ -199,13 +303,23 @@ class CollisionSystem(TCollisionSystem):
         )
 
     def remove_gameobject(self, gameobject: TGameObject) -> None:
-        for layer, colliders in self.collision_layers.items():
-            self.collision_layers[layer] = [
-                collider for collider in colliders if collider.source != gameobject
-            ]
+        entries = self._by_gameobject.pop(gameobject, None)
+        if not entries:
+            return
+        layers = self.collision_layers
+        for layer, collider in entries:
+            layers[layer].remove(collider)
+        self.invalidate()
 
     def get_sequence_hooks(self) -> list[Callable[[int], None]]:
-        return [
-            functools.partial(self.handle_collisions, event_type=COLLISION),
-            functools.partial(self.handle_collisions, event_type=TRIGGER),
-        ]
+        # called every frame, pass the event type positionally
+        # instead of merging keyword arguments through functools.partial
+        handle_collisions = self.handle_collisions
+
+        def handle_physics(dt: int) -> None:
+            handle_collisions(dt, COLLISION)
+
+        def handle_triggers(dt: int) -> None:
+            handle_collisions(dt, TRIGGER)
+
+        return [handle_physics, handle_triggers]
@@ -1,9 +1,9 @@
 from __future__ import annotations
 
 import logging
-from collections.abc import Callable
+from collections import deque
+from collections.abc import Callable, Sequence
 from enum import Enum
-from queue import Queue
 
 import pygame
 
@@ -20,6 +20,9 @@ from pg_engine.core import (
 
 logger = logging.getLogger(__name__)
 
+# shared result for events nobody listens to, never mutated
+_NO_LISTENERS: tuple[Callable, ...] = ()
+
 NOTIFY = pygame.event.custom_type()
 logger.debug("Registered event type 'NOTIFY' as %d", NOTIFY)
 
@@ -45,15 +48,29 @@ class ListenerContainer:
         # the sooner these are filtered out the less work we have to do
         # when we have an event we actually listen for we'll at least
         # likely have a record that listens to it making the work useful
-        self.listeners: dict[int, dict[TGameObject, list[Callable]]] = {}
-        self.broadcast_listeners: dict[int, dict[TScene | None, list[Callable]]] = {}
+        # listeners are stored as tuples, rebuilt on the rare registration
+        # instead of handing out a mutable list on every dispatch
+        self.listeners: dict[int, dict[TGameObject, tuple[Callable, ...]]] = {}
+        self.broadcast_listeners: dict[
+            int,
+            dict[TScene | None, tuple[Callable, ...]],
+        ] = {}
+        #: event types with a bucket in either of the above
+        self.event_types: set[int] = set()
+        #: the `None` scene buckets of :attr:`broadcast_listeners` by event type
+        self.global_listeners: dict[int, tuple[Callable, ...]] = {}
+        # broadcast buckets the listener methods of every gameobject were added to
+        self._broadcasts_by_owner: dict[
+            TGameObject,
+            list[tuple[int, TScene | None, Callable]],
+        ] = {}
 
     @staticmethod
     def _add_listener_to(
         evt_type: int,
         listener: object,
         method: Callable,
-        listener_dict: dict[int, dict[object, list[Callable]]],
+        listener_dict: dict[int, dict[object, tuple[Callable, ...]]],
     ) -> None:
         """
         Categorize a listener into buckets.
@@ -65,17 +82,12 @@ class ListenerContainer:
         :param method: the listener callable
         :type method: Callable
         :param listener_dict: bucket to categorize the listener into
-        :type listener_dict: dict[int, dict[object, list[Callable]]]
+        :type listener_dict: dict[int, dict[object, tuple[Callable, ...]]]
         """
-        evt_type_dict = listener_dict.get(evt_type, {})
-        if evt_type not in listener_dict:
-            listener_dict[evt_type] = evt_type_dict
-        listener_methods = evt_type_dict.get(listener, [])
-        if listener not in evt_type_dict:
-            if hasattr(listener, 'source'):
-                listener = listener.source
-            evt_type_dict[listener] = listener_methods
-        listener_methods.append(method)
+        # components listen on behalf of their gameobject
+        listener = getattr(listener, 'source', listener)
+        evt_type_dict = listener_dict.setdefault(evt_type, {})
+        evt_type_dict[listener] = (*evt_type_dict.get(listener, ()), method)
 
     def add_listener(
         self,
@@ -94,6 +106,7 @@ class ListenerContainer:
         :type method: Callable
         """
         self._add_listener_to(evt_type, listener, method, self.listeners)
+        self.event_types.add(evt_type)
 
     def add_broadcast(
         self,
@@ -112,23 +125,41 @@ class ListenerContainer:
         :type method: Callable
         """
         self._add_listener_to(evt_type, scene, method, self.broadcast_listeners)
+        self.event_types.add(evt_type)
+        if scene is None:
+            self.global_listeners[evt_type] = self.broadcast_listeners[evt_type][None]
+        owner = getattr(method, '__self__', None)
+        if owner is None:
+            return
+        # components listen on behalf of their gameobject, which is what removal
+        # gets passed
+        owner = getattr(owner, 'source', owner)
+        self._broadcasts_by_owner.setdefault(owner, []).append(
+            (evt_type, scene, method),
+        )
 
     @staticmethod
     def _read_listener(
             event: pygame.Event,
-            listener_dict: dict[int, dict[object, list[Callable]]],
+            listener_dict: dict[int, dict[object, tuple[Callable, ...]]],
             listener_target: object | None,
-        ) -> list[Callable]:
-        return listener_dict.get(event.type, {}).get(listener_target, [])
+        ) -> Sequence[Callable]:
+        by_target = listener_dict.get(event.type)
+        if by_target is None:
+            return _NO_LISTENERS
+        return by_target.get(listener_target, _NO_LISTENERS)
 
     def get_listeners(
             self,
             event: pygame.Event,
-        ) -> list[Callable]:
+        ) -> Sequence[Callable]:
+        # most pygame events (eg. mouse motion) have no listeners at all
+        if event.type not in self.event_types:
+            return _NO_LISTENERS
         defined_listener = event.dict.get('listener')
         # by scene
         if defined_listener is None:
-            return self._read_listener(event, self.broadcast_listeners, None)
+            return self.global_listeners.get(event.type, _NO_LISTENERS)
         if isinstance(defined_listener, TScene):
             # broadcast scene
             listener = defined_listener.name
@@ -144,12 +175,15 @@ class ListenerContainer:
         for listenerdict in self.listeners.values():
             if gameobject in listenerdict:
                 del listenerdict[gameobject]
-        for broadcastdict in self.broadcast_listeners.values():
-            for scene, by_scene_list in broadcastdict.items():
-                # filter by owning object
-                broadcastdict[scene] = [
-                    x for x in by_scene_list if x.__self__ is not gameobject
-                ]
+        # only visit the broadcast buckets this object has listeners in
+        owned = self._broadcasts_by_owner.pop(gameobject, ())
+        for evt_type, scene, method in owned:
+            broadcastdict = self.broadcast_listeners[evt_type]
+            broadcastdict[scene] = tuple(
+                x for x in broadcastdict[scene] if x is not method
+            )
+            if scene is None:
+                self.global_listeners[evt_type] = broadcastdict[None]
 
 
 class SystemEventQueue(Singleton):
@@ -157,13 +191,19 @@ class SystemEventQueue(Singleton):
 
     def __init__(self):
         super().__init__()
-        self.queue = Queue()
+        # only used from the game loop, no need for the locking of queue.Queue
+        self.queue: deque[pygame.Event] = deque()
 
-    def get(self) -> list[pygame.Event]:
-        return [self.queue.get() for _ in range(self.queue.qsize())]
+    def get(self) -> deque[pygame.Event]:
+        # events put while handling these end up in the next drain
+        events, self.queue = self.queue, deque()
+        return events
 
     def put(self, event: pygame.Event) -> None:
-        self.queue.put(event)
+        self.queue.append(event)
+
+    def empty(self) -> bool:
+        return not self.queue
 
 
 class EventSystem(TEventSystem):
@@ -175,19 +215,27 @@ class EventSystem(TEventSystem):
         self._eventloop()
 
     def update_system(self, _: int) -> None:
-        self._eventloop(SystemEventQueue())
+        system_events = SystemEventQueue()
+        # drained after every sequence hook, most hooks send nothing
+        if system_events.empty():
+            return
+        self._eventloop(system_events)
 
     def _eventloop(self, event_source: SystemEventQueue | None = None) -> None:
         if event_source is None:
             event_source = pygame.event
+        game = TGame()
+        process_ui_event = game.uimanager.process_events
+        get_listeners = self.event_hooks.get_listeners
+        quit_type = pygame.QUIT
         for event in event_source.get():
-            if event.type == pygame.QUIT:
-                TGame().stop()
-            if TGame().uimanager.process_events(event):
+            if event.type == quit_type:
+                game.stop()
+            if process_ui_event(event):
                 # event processed by pygame_gui are not our
                 # responsibility
                 continue
-            for hook in self.event_hooks.get_listeners(event):
+            for hook in get_listeners(event):
                 hook(event)
 
     @classmethod
@@ -204,14 +252,11 @@ class EventSystem(TEventSystem):
             event = pygame.event.Event(event_type, data)
             pygame.event.post(event)
             return
+        post = SystemEventQueue().put if system else pygame.event.post
         for target in targets:
-            extra_data = data | {'listener': target}
-            # apparently pygame doesn't like "type=..." parameter
-            event = pygame.event.Event(event_type, **extra_data)
-            if not system:
-                pygame.event.post(event)
-                continue
-            SystemEventQueue().put(event)
+            # events are queued until handled, every event needs its own dict
+            # pygame uses a passed dict as is, no kwargs dict built on top
+            post(pygame.event.Event(event_type, {**data, 'listener': target}))
 
     @classmethod
     def broadcast_scene(
@@ -234,12 +279,14 @@ class EventSystem(TEventSystem):
             listener: TGameObject | None,
             hook: Callable[[pygame.Event], None],
         ) -> None:
-        logger.debug(
-            'EventSystem: Registering event hook [%s(%d)] -> %s',
-            pygame.event.event_name(event_type),
-            event_type,
-            hook.__name__,
-        )
+        # module logs at INFO by default, skip looking up the event name
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                'EventSystem: Registering event hook [%s(%d)] -> %s',
+                pygame.event.event_name(event_type),
+                event_type,
+                hook.__name__,
+            )
         self.event_hooks.add_listener(event_type, listener, hook)
 
     def register_broadcast_hook(
@@ -287,17 +334,23 @@ class EventListenerMeta(PostInit):
             if '__create_event_listeners__' in base.__dict__:
                 attrs['__create_event_listeners__'] += base.__create_event_listeners__
         attrs['__create_listener_list__'] = True
-        return super().__new__(meta, name, bases, attrs)
+        cls = super().__new__(meta, name, bases, attrs)
+        listeners = cls.__dict__.get('__create_event_listeners__')
+        if listeners is not None:
+            # listen has added this class' own entries by now, a method overriding
+            # an inherited listener would otherwise be registered twice
+            cls.__create_event_listeners__ = tuple(dict.fromkeys(listeners))
+        return cls
 
 
 class EventListener(metaclass=EventListenerMeta):
     # HACK: this classvar only exists here for typehinting purposes
-    __create_event_listeners__: list
+    __create_event_listeners__: tuple[tuple[int, Scope, str], ...]
 
     def __post_init__(self):
         """Register event listener hooks on object initialization."""
+        sys = TEventSystem()
         for listener in self.__create_event_listeners__:
-            sys = TEventSystem()
             evt_type, scope, fn_name = listener
             # it's hard to have the name wrong unless you forget to functools.wrap
             fn: Callable = getattr(self, fn_name)
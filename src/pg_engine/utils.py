@@ -8,13 +8,8 @@ def apply_transform(*transforms: Iterable[int | float]) -> Iterable[int | float]
     :return: result of the sequentially applied transforms
     :rtype: Iterable[int | float]
     """
-    return tuple(
-        sum(axis)
-        for axis in zip(
-            *transforms,
-            strict=True,
-        )
-    )
+    # map runs sum per axis without a generator frame in between
+    return tuple(map(sum, zip(*transforms, strict=True)))
 
 
 def clip(value: float, min_val: float, max_val: float) -> float:
@@ -30,10 +25,7 @@ def clip(value: float, min_val: float, max_val: float) -> float:
     :return: value if value in domain [min_val, max_val] otherwise whatever is closest
     :rtype: float
     """
-    return max(
-        min_val,
-        min(
-            max_val,
-            value,
-        ),
+    # comparisons instead of calling the min and max builtins
+    return value if min_val <= value <= max_val else (
+        min_val if value < min_val else max_val
     )